@@ -1,23 +1,25 @@
 from __future__ import annotations
 
+import functools
 import sys
-from importlib.metadata import PackageNotFoundError, version as pkg_version
-from typing import List, Sequence
+from typing import FrozenSet, List, Sequence
 
 import typer
-from typer.main import get_command
 
 from click.exceptions import UsageError
 
 from .commands import register_commands
 from sshcore.config import DEFAULT_INCLUDE_FALLBACKS
-from .commands.common import console
+from .commands.common import click_command, console
 
 app = typer.Typer(help="A tiny, modern SSH config explorer.")
 register_commands(app)
 
 
 def _current_version() -> str:
+    # importlib.metadata is comparatively slow to import and only --version needs it.
+    from importlib.metadata import PackageNotFoundError, version as pkg_version
+
     for dist_name in ("ixlab-sshcli", "sshcli"):
         try:
             return pkg_version(dist_name)
@@ -44,18 +46,19 @@ def _root_callback(
         raise typer.Exit()
 
 
-def _command_names() -> List[str]:
-    command_names = [
+@functools.lru_cache(maxsize=1)
+def _command_name_set() -> FrozenSet[str]:
+    command_names = (
         info.name
         for info in app.registered_commands
         if info.name is not None
-    ]
-    group_names = [
+    )
+    group_names = (
         info.name
         for info in app.registered_groups
         if info.name is not None
-    ]
-    return command_names + group_names
+    )
+    return frozenset((*command_names, *group_names))
 
 
 def _rewrite_default_invocation(args: Sequence[str]) -> List[str]:
@@ -63,7 +66,7 @@ def _rewrite_default_invocation(args: Sequence[str]) -> List[str]:
         return list(args)
 
     first, *rest = args
-    if first.startswith("-") or first in _command_names():
+    if first.startswith("-") or first in _command_name_set():
         return list(args)
 
     details = False
@@ -83,7 +86,7 @@ def _rewrite_default_invocation(args: Sequence[str]) -> List[str]:
 
 def run(argv: Sequence[str] | None = None) -> None:
     """Entry point that supports `sshcli <host>` shorthand."""
-    command = get_command(app)
+    command = click_command(app)
     if argv is None:
         argv = tuple(sys.argv[1:])
     rewritten = _rewrite_default_invocation(list(argv))
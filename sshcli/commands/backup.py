@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 import shutil
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -12,11 +13,12 @@ from rich.table import Table
 
 from sshcore import config as config_module
 from sshcore import backups as backups_core
-from .common import console
-from typer.main import get_command
+from .common import click_command, console
 
 backup_app = typer.Typer(help="Inspect, restore, and prune SSH config backups.")
 
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
 
 def _resolve_target(target: Optional[Path]) -> Path:
     base = target or config_module.default_config_path()
@@ -29,10 +31,11 @@ def _format_timestamp(dt: Optional[datetime]) -> str:
     return dt.astimezone().strftime("%Y-%m-%d %H:%M:%S %Z")
 
 
-def _format_age(dt: Optional[datetime]) -> str:
+def _format_age(dt: Optional[datetime], now: Optional[datetime] = None) -> str:
     if dt is None:
         return "unknown"
-    now = datetime.now(tz=timezone.utc)
+    if now is None:
+        now = datetime.now(tz=timezone.utc)
     delta = now - dt
     seconds = max(int(delta.total_seconds()), 0)
     if seconds < 60:
@@ -54,11 +57,10 @@ def _format_age(dt: Optional[datetime]) -> str:
 
 
 def _format_size(size: int) -> str:
-    for unit in ["B", "KB", "MB", "GB"]:
-        if size < 1024 or unit == "GB":
-            return f"{size:.0f}{unit}" if unit == "B" else f"{size / 1024:.1f}{unit}"
-        size /= 1024
-    return f"{size:.1f}GB"
+    if size < 1024:
+        return f"{size}B"
+    idx = min((size.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size / (1 << (idx * 10)):.1f}{_SIZE_UNITS[idx]}"
 
 
 @backup_app.command("list")
@@ -85,12 +87,18 @@ def list_backups(
     table.add_column("Size", justify="right")
     table.add_column("Path", overflow="fold")
 
+    now = datetime.now(tz=timezone.utc)
+    add_row = table.add_row
+    format_timestamp = _format_timestamp
+    format_age = _format_age
+    format_size = _format_size
     for entry in backups:
-        table.add_row(
+        timestamp = entry.timestamp
+        add_row(
             entry.stamp,
-            _format_timestamp(entry.timestamp),
-            _format_age(entry.timestamp),
-            _format_size(entry.size),
+            format_timestamp(timestamp),
+            format_age(timestamp, now),
+            format_size(entry.size),
             str(entry.path),
         )
 
@@ -168,6 +176,12 @@ def prune_backups(
         "--dry-run",
         help="Show which backups would be deleted without removing them.",
     ),
+    verbose: bool = typer.Option(
+        False,
+        "--verbose",
+        "-v",
+        help="List every removed backup instead of only a summary.",
+    ),
 ):
     """Delete old backups by count or timestamp."""
     resolved_target = _resolve_target(target)
@@ -190,9 +204,10 @@ def prune_backups(
 
     removed = _delete_backups(removal_paths)
     if removed:
-        console.print("[green]Removed backups:[/green]")
-        for path in removed:
-            console.print(f"  - {path}")
+        console.print(f"[green]Removed {len(removed)} backup(s).[/green]")
+        if verbose:
+            for path in removed:
+                console.print(f"  - {path}")
     else:
         console.print("[yellow]No backups were removed.[/yellow]")
 
@@ -220,17 +235,12 @@ def _select_backups_to_remove(
     keep: Optional[int],
     cutoff: Optional[datetime],
 ) -> List[Path]:
-    candidates: List[backups_core.BackupEntry] = []
-
-    if keep is not None and keep < len(backups):
-        candidates.extend(backups[keep:])
-
-    if cutoff is not None:
-        for entry in backups:
-            if entry.timestamp is not None and entry.timestamp < cutoff:
-                candidates.append(entry)
-
-    unique_paths = {entry.path for entry in candidates}
+    unique_paths: set[Path] = set()
+    for idx, entry in enumerate(backups):
+        if keep is not None and idx >= keep:
+            unique_paths.add(entry.path)
+        elif cutoff is not None and entry.timestamp is not None and entry.timestamp < cutoff:
+            unique_paths.add(entry.path)
     return sorted(unique_paths)
 
 
@@ -238,7 +248,7 @@ def _delete_backups(paths: List[Path]) -> List[Path]:
     removed: List[Path] = []
     for path in paths:
         try:
-            path.unlink()
+            os.unlink(path)
             removed.append(path)
         except OSError as exc:
             console.print(f"[red]Failed to delete {path}: {exc}[/red]")
@@ -252,7 +262,7 @@ def register(app: typer.Typer) -> None:
 @backup_app.command("help")
 def backup_help() -> None:
     """Show help for the backup command group."""
-    command = get_command(backup_app)
+    command = click_command(backup_app)
     ctx = click.Context(command, info_name="backup")
     typer.echo(command.get_help(ctx))
 
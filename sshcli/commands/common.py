@@ -1,18 +1,29 @@
 from __future__ import annotations
 
 import fnmatch
-from typing import List, Optional, Tuple
+import functools
+import os
+import re
+from typing import Callable, List, Optional, Tuple
 
+import click
 import typer
 from rich import box
 from rich.console import Console
 from rich.table import Table
+from typer.main import get_command
 
 from ..models import HostBlock
 
 console = Console()
 
 
+@functools.lru_cache(maxsize=None)
+def click_command(app: typer.Typer) -> click.Command:
+    """Return the click command built from a Typer app, reusing earlier builds."""
+    return get_command(app)
+
+
 def format_block_table(block: HostBlock) -> Table:
     table = Table(box=box.SIMPLE, show_lines=False)
     table.add_column("Key", style="bold")
@@ -64,14 +75,31 @@ def _best_score_for_block(
     return block_best
 
 
+@functools.lru_cache(maxsize=4096)
+def _compile_pattern(pattern: str) -> Tuple[int, Callable[[str], bool]]:
+    """Return the wildcard count and a matcher equivalent to fnmatch for a Host pattern."""
+    wildcard_count = sum(1 for ch in pattern if ch in "*?[]")
+    normalized = os.path.normcase(pattern)
+    if not any(ch in normalized for ch in "*?["):
+        return wildcard_count, lambda value: value == normalized
+    regex = re.compile(fnmatch.translate(normalized))
+    return wildcard_count, lambda value: regex.match(value) is not None
+
+
 def _score_pattern(name: str, pattern: str, index: int) -> Optional[Tuple[int, int, int, int]]:
-    if not fnmatch.fnmatch(name, pattern):
+    wildcard_count, matches = _compile_pattern(pattern)
+    if not matches(os.path.normcase(name)):
         return None
     literal = 1 if pattern == name else 0
-    wildcard_count = sum(1 for ch in pattern if ch in "*?[]")
     return literal, -wildcard_count, len(pattern), index
 
 
+def filter_blocks_by_tags(blocks: List[HostBlock], tags: List[str]) -> List[HostBlock]:
+    """Keep blocks carrying any of the given tags (case-insensitive)."""
+    wanted = {tag.lower() for tag in tags}
+    return [block for block in blocks if any(tag.lower() in wanted for tag in block.tags)]
+
+
 def parse_option_entry(entry: str) -> Tuple[str, str]:
     if "=" not in entry:
         raise typer.BadParameter("Options must be in KEY=VALUE form.")
@@ -83,4 +111,11 @@ def parse_option_entry(entry: str) -> Tuple[str, str]:
     return key, value
 
 
-__all__ = ["console", "format_block_table", "matching_blocks", "parse_option_entry"]
+__all__ = [
+    "click_command",
+    "console",
+    "filter_blocks_by_tags",
+    "format_block_table",
+    "matching_blocks",
+    "parse_option_entry",
+]
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import typer
 
@@ -53,32 +53,24 @@ def _compute_patterns(set_pattern: Optional[List[str]], block: HostBlock) -> Lis
 def _initial_options(
     block: HostBlock,
     clear_options: bool,
-) -> List[Tuple[str, str]]:
+) -> Dict[str, Tuple[str, str]]:
     if clear_options:
-        return []
-    return list(block.options.items())
+        return {}
+    return {key.lower(): (key, value) for key, value in block.options.items()}
 
 
-def _set_option(options: List[Tuple[str, str]], key: str, value: str) -> None:
+def _set_option(options: Dict[str, Tuple[str, str]], key: str, value: str) -> None:
     lower = key.lower()
-    for idx, (existing_key, _) in enumerate(options):
-        if existing_key.lower() == lower:
-            options[idx] = (existing_key, value)
-            return
-    options.append((key, value))
+    existing = options.get(lower)
+    options[lower] = (existing[0] if existing is not None else key, value)
 
 
-def _remove_option(options: List[Tuple[str, str]], key: str) -> bool:
-    lower = key.lower()
-    for idx, (existing_key, _) in enumerate(options):
-        if existing_key.lower() == lower:
-            del options[idx]
-            return True
-    return False
+def _remove_option(options: Dict[str, Tuple[str, str]], key: str) -> bool:
+    return options.pop(key.lower(), None) is not None
 
 
 def _apply_option_updates(
-    options: List[Tuple[str, str]],
+    options: Dict[str, Tuple[str, str]],
     hostname: Optional[str],
     user: Optional[str],
     port: Optional[int],
@@ -110,7 +102,7 @@ def _apply_option_updates(
         _set_option(options, key, value)
 
 
-def _remove_declared_options(options: List[Tuple[str, str]], remove_option: List[str]) -> None:
+def _remove_declared_options(options: Dict[str, Tuple[str, str]], remove_option: List[str]) -> None:
     for key in remove_option:
         removed = _remove_option(options, key)
         if not removed:
@@ -160,12 +152,14 @@ def register(app: typer.Typer) -> None:
         blocks = _load_blocks_for_target(resolved_target)
         block = _select_block_for_edit(name, blocks, resolved_target)
         new_patterns = _compute_patterns(set_pattern, block)
-        options_list = _initial_options(block, clear_options)
+        options = _initial_options(block, clear_options)
 
-        _apply_option_updates(options_list, hostname, user, port, option)
-        _remove_declared_options(options_list, remove_option)
+        _apply_option_updates(options, hostname, user, port, option)
+        _remove_declared_options(options, remove_option)
 
-        backup = config_module.replace_host_block(resolved_target, block, new_patterns, options_list)
+        backup = config_module.replace_host_block(
+            resolved_target, block, new_patterns, list(options.values())
+        )
         console.print(
             f"[green]Updated Host block {' '.join(new_patterns)} in {resolved_target}.[/green]"
         )
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import fnmatch
-from typing import List, Tuple
+import os
+import re
+from typing import Callable, List, Tuple
 
 import typer
 from rich import box
@@ -9,7 +11,20 @@ from rich.table import Table
 
 from sshcore import config as config_module
 from ..models import HostBlock
-from .common import console
+from .common import console, filter_blocks_by_tags
+
+
+def _wildcard_matcher(query: str) -> Callable[[str], bool]:
+    """Compile the query once with the same semantics as fnmatch.fnmatch(value, query)."""
+    match = re.compile(fnmatch.translate(os.path.normcase(query))).match
+    return lambda value: match(os.path.normcase(value)) is not None
+
+
+def _block_matches(block: HostBlock, needle: str, wildcard_match: Callable[[str], bool]) -> bool:
+    if any(needle in pattern.lower() or wildcard_match(pattern) for pattern in block.patterns):
+        return True
+    host_name = block.options.get("HostName", "")
+    return needle in host_name.lower() or wildcard_match(host_name)
 
 
 def register(app: typer.Typer) -> None:
@@ -23,20 +38,18 @@ def register(app: typer.Typer) -> None:
         
         # Apply tag filter first
         if tag:
-            blocks = [b for b in blocks if any(b.has_tag(t) for t in tag)]
+            blocks = filter_blocks_by_tags(blocks, tag)
         
         hits: List[Tuple[str, HostBlock]] = []
+        wildcard_match = _wildcard_matcher(query)
+        needle = query.lower()
 
         for block in blocks:
-            patterns_match = any(
-                fnmatch.fnmatch(pattern, query) or query.lower() in pattern.lower()
-                for pattern in block.patterns
-            )
-            host_name = block.options.get("HostName", "")
-            hostname_match = fnmatch.fnmatch(host_name, query) or query.lower() in host_name.lower()
-            if patterns_match or hostname_match:
-                label = ", ".join(block.names_for_listing or block.patterns)
-                hits.append((label, block))
+            # An empty query is a substring of everything, so skip the per-block tests.
+            if needle and not _block_matches(block, needle, wildcard_match):
+                continue
+            label = ", ".join(block.names_for_listing or block.patterns)
+            hits.append((label, block))
 
         if not hits:
             console.print(f"[yellow]No results for '{query}'.[/yellow]")
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Tuple, Union
+
 import typer
 from rich.table import Table
 
@@ -20,7 +24,11 @@ _OUTPUT_PARTIAL = "[yellow]partial[/yellow]"
 
 @key_app.command("add")
 def add_key(
-    name: str = typer.Argument(..., help="Name identifier for the key.", metavar="NAME"),
+    name: List[str] = typer.Argument(
+        ...,
+        help="Name identifier for the key. Repeat to generate several keys in parallel.",
+        metavar="NAME",
+    ),
     size: int = typer.Option(2048, help="Size of the key to generate (in bits).", metavar="SIZE"),
     public_exponent: int = typer.Option(
         65537, help="Public exponent for RSA keys.", metavar="PUBLIC_EXPONENT"
@@ -64,29 +72,83 @@ def add_key(
     verbose: bool = typer.Option(False, help="Enable verbose output.", metavar="VERBOSE"),
 ) -> None:
     """Generate and store a new key pair."""
-    try:
-        result = core_keys.generate_key_pair(
-            name=name,
-            size=size,
-            public_exponent=public_exponent,
-            path=path,
-            key_type=key_type,
-            password=password,
-            comment=comment,
-            private_format=private_format,
-            private_encoding=private_encoding,
-            public_format=public_format,
-            public_encoding=public_encoding,
-            overwrite=overwrite,
-            verbose=verbose,
+    names = list(dict.fromkeys(name))
+    options: Dict[str, Any] = dict(
+        size=size,
+        public_exponent=public_exponent,
+        path=path,
+        key_type=key_type,
+        password=password,
+        comment=comment,
+        private_format=private_format,
+        private_encoding=private_encoding,
+        public_format=public_format,
+        public_encoding=public_encoding,
+        overwrite=overwrite,
+    )
+    if verbose:
+        console.print(
+            f"[dim]Writing to '{path}' (private: {private_format}/{private_encoding}, "
+            f"public: {public_format}/{public_encoding}).[/dim]"
         )
-    except core_keys.KeyOperationError as exc:
-        console.print(f"[red]{exc}[/red]")
+    label = f"'{names[0]}'" if len(names) == 1 else f"{len(names)} keys"
+    outcomes = _generate_key_pairs(names, options, f"Generating {size}-bit {key_type.upper()} {label}...")
+
+    failed = False
+    for key_name, outcome in outcomes:
+        if isinstance(outcome, core_keys.KeyOperationError):
+            console.print(f"[red]{outcome}[/red]")
+            failed = True
+            continue
+        if isinstance(outcome, Exception):
+            console.print(f"[red]Failed to generate key '{key_name}': {outcome}[/red]")
+            failed = True
+            continue
+        console.print(
+            f"[green]Generated key '{key_name}' (Private: '{outcome.private_path}', Public: '{outcome.public_path}')[/green]"
+        )
+
+    if failed:
         raise typer.Exit(code=1)
 
-    console.print(
-        f"[green]Generated key '{name}' (Private: '{result.private_path}', Public: '{result.public_path}')[/green]"
-    )
+
+def _generate_key_pairs(
+    names: List[str],
+    options: Dict[str, Any],
+    status: str,
+) -> List[Tuple[str, Union[core_keys.KeyGenerationResult, Exception]]]:
+    """Generate one key pair per name, fanning out to worker processes for batches."""
+    if len(names) == 1:
+        with console.status(status):
+            return [_generate_outcome(names[0], options)]
+
+    # RSA prime search is CPU-bound, so separate processes scale with the core count.
+    workers = min(len(names), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Submit before the status spinner starts its refresh thread so workers
+        # are never forked from a multi-threaded process.
+        futures = [
+            (key_name, executor.submit(core_keys.generate_key_pair, name=key_name, **options))
+            for key_name in names
+        ]
+        outcomes: List[Tuple[str, Union[core_keys.KeyGenerationResult, Exception]]] = []
+        with console.status(status):
+            for key_name, future in futures:
+                try:
+                    outcomes.append((key_name, future.result()))
+                except Exception as exc:  # report per key so finished keys are still listed
+                    outcomes.append((key_name, exc))
+    return outcomes
+
+
+def _generate_outcome(
+    key_name: str,
+    options: Dict[str, Any],
+) -> Tuple[str, Union[core_keys.KeyGenerationResult, Exception]]:
+    try:
+        return key_name, core_keys.generate_key_pair(name=key_name, **options)
+    except Exception as exc:
+        return key_name, exc
 
 
 @key_app.command("list")
@@ -7,7 +7,7 @@ from rich import box
 from rich.table import Table
 
 from sshcore import config as config_module
-from .common import console
+from .common import console, filter_blocks_by_tags
 
 
 def register(app: typer.Typer) -> None:
@@ -24,7 +24,7 @@ def register(app: typer.Typer) -> None:
         
         # Filter by tags if specified
         if tag:
-            blocks = [b for b in blocks if any(b.has_tag(t) for t in tag)]
+            blocks = filter_blocks_by_tags(blocks, tag)
         
         if not blocks:
             console.print("[yellow]No SSH host blocks found.[/yellow]")
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections import Counter
+from itertools import chain
 from typing import List
 
 import typer
@@ -7,7 +9,7 @@ import typer
 from sshcore import config as config_module, settings as settings_module
 from sshcore.models import HostBlock
 
-from .common import console
+from .common import console, filter_blocks_by_tags
 
 
 def register(app: typer.Typer) -> None:
@@ -77,18 +79,13 @@ def register(app: typer.Typer) -> None:
     def list_tags() -> None:
         """List all tags and their usage counts."""
         blocks = config_module.load_host_blocks()
-        tag_counts: dict[str, int] = {}
-
-        for block in blocks:
-            for tag in block.tags:
-                tag_counts[tag] = tag_counts.get(tag, 0) + 1
+        tag_counts = Counter(chain.from_iterable(block.tags for block in blocks))
 
         if not tag_counts:
             console.print("[yellow]No tags found[/yellow]")
             return
 
-        for tag in sorted(tag_counts.keys()):
-            count = tag_counts[tag]
+        for tag, count in sorted(tag_counts.items()):
             console.print(f"{tag} ({count} host{'s' if count != 1 else ''})")
 
     @tag_app.command("show")
@@ -97,7 +94,7 @@ def register(app: typer.Typer) -> None:
     ) -> None:
         """Show all hosts with a specific tag."""
         blocks = config_module.load_host_blocks()
-        matching = [b for b in blocks if b.has_tag(tag)]
+        matching = filter_blocks_by_tags(blocks, [tag])
 
         if not matching:
             console.print(f"[yellow]No hosts found with tag '{tag}'[/yellow]")
@@ -2,10 +2,11 @@ from pathlib import Path
 
 import pytest
 
+from sshcore import config as config_module
 from sshcore.models import HostBlock
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def host_block_factory():
     def _make(
         patterns,
@@ -23,3 +24,13 @@ def host_block_factory():
         return block
 
     return _make
+
+
+@pytest.fixture()
+def patch_host_blocks(monkeypatch):
+    """Make `load_host_blocks` return the given blocks for every command module."""
+
+    def _patch(blocks):
+        monkeypatch.setattr(config_module, "load_host_blocks", lambda: blocks)
+
+    return _patch
@@ -12,6 +12,13 @@ def test_rewrite_default_invocation_preserves_commands_and_flags():
     assert _rewrite_default_invocation(["--help"]) == ["--help"]
 
 
+def test_rewrite_default_invocation_returns_a_copy():
+    args = ["list", "--files"]
+    assert _rewrite_default_invocation(args) is not args
+    empty: list[str] = []
+    assert _rewrite_default_invocation(empty) is not empty
+
+
 def test_run_passes_rewritten_arguments(monkeypatch):
     calls = {}
 
@@ -22,7 +29,7 @@ def test_run_passes_rewritten_arguments(monkeypatch):
             calls["standalone"] = standalone_mode
 
     dummy = DummyCommand()
-    monkeypatch.setattr("sshcli.cli.get_command", lambda app: dummy)
+    monkeypatch.setattr("sshcli.cli.click_command", lambda app: dummy)
 
     run(["my-host", "--details", "--flag"])
 
@@ -37,7 +44,7 @@ def test_run_handles_usage_error(monkeypatch, capsys):
             ctx = click.Context(click.Command("dummy"))
             raise click.UsageError("invalid invocation", ctx=ctx)
 
-    monkeypatch.setattr("sshcli.cli.get_command", lambda app: DummyCommand())
+    monkeypatch.setattr("sshcli.cli.click_command", lambda app: DummyCommand())
 
     run(["invalid"])
     captured = capsys.readouterr()
@@ -96,3 +96,53 @@ def test_resolve_target_uses_default(monkeypatch, tmp_path):
 
     resolved = backup_module._resolve_target(None)
     assert resolved == default
+
+
+def test_format_age_uses_reference_time():
+    now = datetime(2024, 1, 2, tzinfo=timezone.utc)
+    assert backup_module._format_age(now - timedelta(hours=3), now) == "3h ago"
+    assert backup_module._format_age(None, now) == "unknown"
+
+
+def test_select_backups_to_remove_deduplicates_overlapping_filters(tmp_path):
+    now = datetime.now(tz=timezone.utc)
+    entries = [
+        backups_core.BackupEntry(tmp_path / "b", "b", now, 100),
+        backups_core.BackupEntry(tmp_path / "a", "a", now - timedelta(days=10), 100),
+        backups_core.BackupEntry(tmp_path / "c", "c", None, 100),
+    ]
+
+    to_remove = backup_module._select_backups_to_remove(
+        entries, keep=1, cutoff=now - timedelta(days=1)
+    )
+    assert to_remove == [tmp_path / "a", tmp_path / "c"]
+
+
+def test_backup_prune_prints_summary_unless_verbose(monkeypatch, tmp_path):
+    target = tmp_path / "config"
+    target.write_text("")
+
+    def entries():
+        return [
+            _make_entry(tmp_path, "20240101010101", seconds_ago=60),
+            _make_entry(tmp_path, "20231224083000", seconds_ago=3600),
+        ]
+
+    monkeypatch.setattr(backup_module, "_resolve_target", lambda t=None: target)
+    monkeypatch.setattr(backup_module.backups_core, "discover_backups", lambda resolved: entries())
+
+    result = runner.invoke(app, ["backup", "prune", "--keep", "0"])
+    assert result.exit_code == 0
+    assert "Removed 2 backup(s)." in result.stdout
+    assert "20231224083000" not in result.stdout
+
+    result = runner.invoke(app, ["backup", "prune", "--keep", "0", "--verbose"])
+    assert result.exit_code == 0
+    assert "20231224083000" in result.stdout.replace("\n", "")
+
+
+def test_format_size_picks_unit():
+    assert backup_module._format_size(512) == "512B"
+    assert backup_module._format_size(2048) == "2.0KB"
+    assert backup_module._format_size(5 * 1024 * 1024) == "5.0MB"
+    assert backup_module._format_size(3 * 1024**5) == "3072.0TB"
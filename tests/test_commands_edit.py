@@ -0,0 +1,63 @@
+from typer.testing import CliRunner
+
+from sshcli.cli import app
+from sshcli.commands import edit as edit_module
+
+
+runner = CliRunner()
+
+
+def test_edit_updates_options_case_insensitively(monkeypatch, tmp_path, host_block_factory):
+    target = tmp_path / "config"
+    target.write_text("Host app\n")
+    block = host_block_factory(
+        ["app"],
+        source=str(target),
+        options={"hostname": "old.example", "User": "root", "Port": "22"},
+    )
+    monkeypatch.setattr(edit_module, "_load_blocks_for_target", lambda resolved: [block])
+
+    recorded = {}
+
+    def fake_replace(path, selected_block, patterns, options):
+        recorded["patterns"] = patterns
+        recorded["options"] = options
+
+    monkeypatch.setattr(edit_module.config_module, "replace_host_block", fake_replace)
+
+    result = runner.invoke(
+        app,
+        [
+            "edit",
+            "app",
+            "--hostname",
+            "new.example",
+            "--option",
+            "identityfile=~/.ssh/id_rsa",
+            "--option",
+            "port=2222",
+            "--remove-option",
+            "user",
+            "--target",
+            str(target),
+        ],
+    )
+    assert result.exit_code == 0
+    assert recorded["patterns"] == ["app"]
+    assert recorded["options"] == [
+        ("hostname", "new.example"),
+        ("Port", "2222"),
+        ("identityfile", "~/.ssh/id_rsa"),
+    ]
+
+
+def test_edit_reports_missing_option_removal(monkeypatch, tmp_path, host_block_factory):
+    target = tmp_path / "config"
+    target.write_text("Host app\n")
+    block = host_block_factory(["app"], source=str(target), options={"HostName": "app.example"})
+    monkeypatch.setattr(edit_module, "_load_blocks_for_target", lambda resolved: [block])
+    monkeypatch.setattr(edit_module.config_module, "replace_host_block", lambda *args: None)
+
+    result = runner.invoke(app, ["edit", "app", "-r", "User", "--target", str(target)])
+    assert result.exit_code == 0
+    assert "not present" in result.stdout
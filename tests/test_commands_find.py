@@ -7,11 +7,11 @@ from sshcli.commands import find as find_module
 runner = CliRunner()
 
 
-def test_find_hosts_filters_by_tag(monkeypatch, host_block_factory):
+def test_find_hosts_filters_by_tag(patch_host_blocks, host_block_factory):
     prod = host_block_factory(["app-prod"], options={"HostName": "prod.example"}, tags=["prod"])
     staging = host_block_factory(["app-staging"], options={"HostName": "staging.example"}, tags=["staging"])
 
-    monkeypatch.setattr(find_module.config_module, "load_host_blocks", lambda: [prod, staging])
+    patch_host_blocks([prod, staging])
 
     result = runner.invoke(app, ["find", "app*", "--tag", "prod"])
     assert result.exit_code == 0
@@ -19,10 +19,30 @@ def test_find_hosts_filters_by_tag(monkeypatch, host_block_factory):
     assert "staging.example" not in result.stdout
 
 
-def test_find_hosts_reports_missing(monkeypatch, host_block_factory):
+def test_find_hosts_reports_missing(patch_host_blocks, host_block_factory):
     block = host_block_factory(["db"], options={"HostName": "db.example"})
-    monkeypatch.setattr(find_module.config_module, "load_host_blocks", lambda: [block])
+    patch_host_blocks([block])
 
     result = runner.invoke(app, ["find", "web*"])
     assert result.exit_code == 0
     assert "No results" in result.stdout
+
+
+def test_wildcard_matcher_matches_like_fnmatch():
+    match = find_module._wildcard_matcher("app-?.example.*")
+    assert match("app-1.example.com")
+    assert not match("app-10.example.com")
+    assert find_module._wildcard_matcher("db")("db")
+
+
+def test_find_hosts_empty_query_lists_everything(patch_host_blocks, host_block_factory):
+    blocks = [
+        host_block_factory(["db"], options={"HostName": "db.example"}),
+        host_block_factory(["web-*"], options={"HostName": "web.example"}),
+    ]
+    patch_host_blocks(blocks)
+
+    result = runner.invoke(app, ["find", ""])
+    assert result.exit_code == 0
+    assert "db.example" in result.stdout
+    assert "web.example" in result.stdout
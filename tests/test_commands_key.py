@@ -1,3 +1,5 @@
+import inspect
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -9,6 +11,17 @@ from sshcore import keys as core_keys
 
 
 runner = CliRunner()
+_GENERATE_SIGNATURE = inspect.signature(core_keys.generate_key_pair)
+
+
+def _strict(fake):
+    """Wrap a fake so it rejects arguments the real generate_key_pair does not accept."""
+
+    def wrapper(*args, **kwargs):
+        _GENERATE_SIGNATURE.bind(*args, **kwargs)
+        return fake(**kwargs)
+
+    return wrapper
 
 
 def test_key_add_generates_pair(monkeypatch, tmp_path):
@@ -21,7 +34,7 @@ def test_key_add_generates_pair(monkeypatch, tmp_path):
             public_path=Path(tmp_path / "id_rsa.pub"),
         )
 
-    monkeypatch.setattr(key_module.core_keys, "generate_key_pair", fake_generate)
+    monkeypatch.setattr(key_module.core_keys, "generate_key_pair", _strict(fake_generate))
 
     result = runner.invoke(app, ["key", "add", "id_rsa", "--path", str(tmp_path)])
     assert result.exit_code == 0
@@ -29,11 +42,52 @@ def test_key_add_generates_pair(monkeypatch, tmp_path):
     assert "Generated key" in result.stdout
 
 
+def test_key_add_generates_multiple_pairs(monkeypatch, tmp_path):
+    generated = []
+
+    def fake_generate(**kwargs):
+        if kwargs["name"] == "broken":
+            raise core_keys.KeyOperationError("cannot write broken")
+        generated.append(kwargs["name"])
+        return core_keys.KeyGenerationResult(
+            private_path=Path(tmp_path / kwargs["name"]),
+            public_path=Path(tmp_path / f"{kwargs['name']}.pub"),
+        )
+
+    monkeypatch.setattr(key_module.core_keys, "generate_key_pair", _strict(fake_generate))
+    monkeypatch.setattr(key_module, "ProcessPoolExecutor", ThreadPoolExecutor)
+
+    result = runner.invoke(app, ["key", "add", "alpha", "broken", "beta", "alpha", "--path", str(tmp_path)])
+    assert result.exit_code == 1
+    assert sorted(generated) == ["alpha", "beta"]
+    assert "Generated key 'alpha'" in result.stdout
+    assert "Generated key 'beta'" in result.stdout
+    assert "cannot write broken" in result.stdout
+
+
+def test_key_add_reports_unexpected_errors_per_key(monkeypatch, tmp_path):
+    def fake_generate(**kwargs):
+        if kwargs["name"] == "weak":
+            raise ValueError("public_exponent must be 3 or 65537")
+        return core_keys.KeyGenerationResult(
+            private_path=Path(tmp_path / kwargs["name"]),
+            public_path=Path(tmp_path / f"{kwargs['name']}.pub"),
+        )
+
+    monkeypatch.setattr(key_module.core_keys, "generate_key_pair", _strict(fake_generate))
+    monkeypatch.setattr(key_module, "ProcessPoolExecutor", ThreadPoolExecutor)
+
+    result = runner.invoke(app, ["key", "add", "weak", "alpha", "--path", str(tmp_path)])
+    assert result.exit_code == 1
+    assert "Failed to generate key 'weak': public_exponent must be 3 or 65537" in result.stdout
+    assert "Generated key 'alpha'" in result.stdout
+
+
 def test_key_add_reports_errors(monkeypatch):
     def fake_generate(**kwargs):
         raise core_keys.KeyOperationError("boom")
 
-    monkeypatch.setattr(key_module.core_keys, "generate_key_pair", fake_generate)
+    monkeypatch.setattr(key_module.core_keys, "generate_key_pair", _strict(fake_generate))
 
     result = runner.invoke(app, ["key", "add", "id_rsa"])
     assert result.exit_code == 1
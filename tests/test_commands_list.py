@@ -8,7 +8,7 @@ from sshcli.commands import list as list_module
 runner = CliRunner()
 
 
-def test_list_hosts_displays_patterns_and_files(monkeypatch, host_block_factory):
+def test_list_hosts_displays_patterns_and_files(monkeypatch, host_block_factory, patch_host_blocks):
     record_console = Console(record=True, force_terminal=False, width=120)
     monkeypatch.setattr(list_module, "console", record_console)
 
@@ -27,7 +27,7 @@ def test_list_hosts_displays_patterns_and_files(monkeypatch, host_block_factory)
             options={"HostName": "staging.example.com"},
         ),
     ]
-    monkeypatch.setattr(list_module.config_module, "load_host_blocks", lambda: blocks)
+    patch_host_blocks(blocks)
 
     result = runner.invoke(app, ["list", "--patterns", "--files"])
     assert result.exit_code == 0
@@ -38,7 +38,7 @@ def test_list_hosts_displays_patterns_and_files(monkeypatch, host_block_factory)
     assert "staging-*" in output
 
 
-def test_list_hosts_filters_by_tag(monkeypatch, host_block_factory):
+def test_list_hosts_filters_by_tag(monkeypatch, host_block_factory, patch_host_blocks):
     record_console = Console(record=True, force_terminal=False, width=120)
     monkeypatch.setattr(list_module, "console", record_console)
 
@@ -52,7 +52,7 @@ def test_list_hosts_filters_by_tag(monkeypatch, host_block_factory):
         options={"HostName": "staging"},
         tags=["staging"],
     )
-    monkeypatch.setattr(list_module.config_module, "load_host_blocks", lambda: [prod, staging])
+    patch_host_blocks([prod, staging])
 
     result = runner.invoke(app, ["list", "--tag", "prod"])
     assert result.exit_code == 0
@@ -61,10 +61,10 @@ def test_list_hosts_filters_by_tag(monkeypatch, host_block_factory):
     assert "staging" not in output
 
 
-def test_list_hosts_handles_empty(monkeypatch):
+def test_list_hosts_handles_empty(monkeypatch, patch_host_blocks):
     record_console = Console(record=True, force_terminal=False, width=120)
     monkeypatch.setattr(list_module, "console", record_console)
-    monkeypatch.setattr(list_module.config_module, "load_host_blocks", lambda: [])
+    patch_host_blocks([])
     result = runner.invoke(app, ["list"])
     assert result.exit_code == 0
     assert "No SSH host blocks found" in record_console.export_text()
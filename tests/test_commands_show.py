@@ -1,15 +1,14 @@
 from typer.testing import CliRunner
 
 from sshcli.cli import app
-from sshcli.commands import show as show_module
 
 
 runner = CliRunner()
 
 
-def test_show_host_displays_primary_block(monkeypatch, host_block_factory):
+def test_show_host_displays_primary_block(patch_host_blocks, host_block_factory):
     block = host_block_factory(["app"], options={"HostName": "app.example"})
-    monkeypatch.setattr(show_module.config_module, "load_host_blocks", lambda: [block])
+    patch_host_blocks([block])
 
     result = runner.invoke(app, ["show", "app"])
     assert result.exit_code == 0
@@ -17,10 +16,10 @@ def test_show_host_displays_primary_block(monkeypatch, host_block_factory):
     assert "Host app" in result.stdout
 
 
-def test_show_host_details_lists_all_matches(monkeypatch, host_block_factory):
+def test_show_host_details_lists_all_matches(patch_host_blocks, host_block_factory):
     primary = host_block_factory(["api"], options={"HostName": "api.example"})
     wildcard = host_block_factory(["api*"], options={"HostName": "fallback"})
-    monkeypatch.setattr(show_module.config_module, "load_host_blocks", lambda: [primary, wildcard])
+    patch_host_blocks([primary, wildcard])
 
     result = runner.invoke(app, ["show", "api", "--details"])
     assert result.exit_code == 0
@@ -28,8 +27,8 @@ def test_show_host_details_lists_all_matches(monkeypatch, host_block_factory):
     assert result.stdout.count("Host api") >= 1
 
 
-def test_show_host_reports_missing(monkeypatch):
-    monkeypatch.setattr(show_module.config_module, "load_host_blocks", lambda: [])
+def test_show_host_reports_missing(patch_host_blocks):
+    patch_host_blocks([])
 
     result = runner.invoke(app, ["show", "missing"])
     assert result.exit_code == 1
@@ -7,9 +7,9 @@ from sshcli.commands import tag as tag_module
 runner = CliRunner()
 
 
-def test_tag_add_requires_defined_tags(monkeypatch, host_block_factory):
+def test_tag_add_requires_defined_tags(monkeypatch, host_block_factory, patch_host_blocks):
     block = host_block_factory(["app"])
-    monkeypatch.setattr(tag_module.config_module, "load_host_blocks", lambda: [block])
+    patch_host_blocks([block])
     monkeypatch.setattr(tag_module.settings_module, "get_tag_definitions", lambda: {})
 
     result = runner.invoke(app, ["tag", "add", "app", "prod"])
@@ -17,7 +17,7 @@ def test_tag_add_requires_defined_tags(monkeypatch, host_block_factory):
     assert "not defined" in result.stdout
 
 
-def test_tag_add_updates_block_and_persists(monkeypatch, host_block_factory):
+def test_tag_add_updates_block_and_persists(monkeypatch, host_block_factory, patch_host_blocks):
     block = host_block_factory(["app"], tags=["existing"])
     saved = {}
 
@@ -25,7 +25,7 @@ def test_tag_add_updates_block_and_persists(monkeypatch, host_block_factory):
         saved["target"] = target
         saved["block"] = updated_block
 
-    monkeypatch.setattr(tag_module.config_module, "load_host_blocks", lambda: [block])
+    patch_host_blocks([block])
     monkeypatch.setattr(tag_module.config_module, "replace_host_block_with_metadata", fake_replace)
     monkeypatch.setattr(
         tag_module.settings_module,
@@ -41,14 +41,14 @@ def test_tag_add_updates_block_and_persists(monkeypatch, host_block_factory):
     assert "existing" in saved["block"].tags
 
 
-def test_tag_remove_updates_metadata(monkeypatch, host_block_factory):
+def test_tag_remove_updates_metadata(monkeypatch, host_block_factory, patch_host_blocks):
     block = host_block_factory(["app"], tags=["Prod", "Blue"])
     saved = {}
 
     def fake_replace(target, updated_block, patterns, options):
         saved["tags"] = list(updated_block.tags)
 
-    monkeypatch.setattr(tag_module.config_module, "load_host_blocks", lambda: [block])
+    patch_host_blocks([block])
     monkeypatch.setattr(tag_module.config_module, "replace_host_block_with_metadata", fake_replace)
 
     result = runner.invoke(app, ["tag", "remove", "app", "prod"])
@@ -72,11 +72,11 @@ def test_tag_color_updates_definitions(monkeypatch):
     assert recorded["payload"]["staging"] == "#00ff00"
 
 
-def test_tag_list_displays_counts(monkeypatch, host_block_factory):
+def test_tag_list_displays_counts(patch_host_blocks, host_block_factory):
     block_one = host_block_factory(["app"], tags=["prod", "blue"])
     block_two = host_block_factory(["db"], tags=["prod"])
 
-    monkeypatch.setattr(tag_module.config_module, "load_host_blocks", lambda: [block_one, block_two])
+    patch_host_blocks([block_one, block_two])
 
     result = runner.invoke(app, ["tag", "list"])
     assert result.exit_code == 0
@@ -84,25 +84,25 @@ def test_tag_list_displays_counts(monkeypatch, host_block_factory):
     assert "blue (1 host)" in result.stdout
 
 
-def test_tag_list_reports_empty(monkeypatch):
-    monkeypatch.setattr(tag_module.config_module, "load_host_blocks", lambda: [])
+def test_tag_list_reports_empty(patch_host_blocks):
+    patch_host_blocks([])
 
     result = runner.invoke(app, ["tag", "list"])
     assert result.exit_code == 0
     assert "No tags found" in result.stdout
 
 
-def test_tag_show_displays_matching_hosts(monkeypatch, host_block_factory):
+def test_tag_show_displays_matching_hosts(patch_host_blocks, host_block_factory):
     block = host_block_factory(["app"], options={"HostName": "app.example"}, tags=["prod"])
-    monkeypatch.setattr(tag_module.config_module, "load_host_blocks", lambda: [block])
+    patch_host_blocks([block])
 
     result = runner.invoke(app, ["tag", "show", "prod"])
     assert result.exit_code == 0
     assert "app.example" in result.stdout
 
 
-def test_tag_show_reports_missing(monkeypatch):
-    monkeypatch.setattr(tag_module.config_module, "load_host_blocks", lambda: [])
+def test_tag_show_reports_missing(patch_host_blocks):
+    patch_host_blocks([])
 
     result = runner.invoke(app, ["tag", "show", "prod"])
     assert result.exit_code == 0
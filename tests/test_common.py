@@ -45,3 +45,20 @@ def test_format_block_table_includes_tags(host_block_factory):
     console.print(table)
     output = console.export_text()
     assert "prod, web" in output
+
+
+def test_score_pattern_matches_like_fnmatch():
+    assert common._score_pattern("web-01", "web-01", 3) == (1, 0, 6, 3)
+    assert common._score_pattern("web-01", "web-*", 2) == (0, -1, 5, 2)
+    assert common._score_pattern("web-01", "web-0[0-9]", 1) == (0, -2, 10, 1)
+    assert common._score_pattern("web-01", "db-*", 0) is None
+    assert common._score_pattern("web-01", "web-02", 0) is None
+
+
+def test_filter_blocks_by_tags_is_case_insensitive(host_block_factory):
+    prod = host_block_factory(["app"], tags=["Prod", "web"])
+    staging = host_block_factory(["stage"], tags=["staging"])
+    untagged = host_block_factory(["misc"])
+
+    assert common.filter_blocks_by_tags([prod, staging, untagged], ["PROD"]) == [prod]
+    assert common.filter_blocks_by_tags([prod, staging, untagged], ["web", "staging"]) == [prod, staging]